@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from collections.abc import Mapping
 from pathlib import Path
@@ -141,6 +142,17 @@ def _try_format_image(value: object) -> str | None:
         return None
 
 
+def _card_digest(front: str, back: str, tags: str = "") -> bytes:
+    """Short content digest used to detect unchanged cards in upsert_deck."""
+    h = hashlib.blake2b(digest_size=8)
+    h.update(front.encode("utf-8"))
+    h.update(b"\x1f")
+    h.update(back.encode("utf-8"))
+    h.update(b"\x1f")
+    h.update(tags.encode("utf-8"))
+    return h.digest()
+
+
 def upsert_deck(data: str | Mapping[str, Any], *, deck_name: str | None = None) -> Deck:
     """
     Create or update a deck with cards from a dict or JSON file.
@@ -193,8 +205,10 @@ def upsert_deck(data: str | Mapping[str, Any], *, deck_name: str | None = None)
     except Exception:
         deck_obj = create_deck(target_name)
 
-    existing_fronts = {c.front: c for c in deck_obj.cards}
+    existing_fronts = deck_obj.cards.by_front()
 
+    adds: list[dict[str, Any]] = []
+    updates: list[dict[str, Any]] = []
     for card in cards:
         raw_front = card.get("front", "")
         raw_back = card.get("back", "")
@@ -223,33 +237,26 @@ def upsert_deck(data: str | Mapping[str, Any], *, deck_name: str | None = None)
 
         if note_id:
             # Explicit note_id - always update
-            _client.update_card(
-                note_id=note_id, front=front, back=back, tags=tags, deck_id=deck_obj.id
-            )
+            updates.append({"note_id": note_id, "front": front, "back": back, "tags": tags})
         else:
             # Try to find existing card by raw_front OR processed front
             # (handles both plain text and already-formatted cards)
             existing = existing_fronts.get(raw_front) or existing_fronts.get(front)
 
             if existing and existing.id is not None:
-                # Update if front, back, or tags changed
-                needs_update = (
-                    existing.front != front
-                    or existing.back != back
-                    or (tags and tags != getattr(existing, "tags", ""))
+                # Skip cards whose content digest is unchanged
+                existing_digest = _card_digest(
+                    existing.front, existing.back, getattr(existing, "tags", "") or ""
                 )
-                if needs_update:
-                    _client.update_card(
-                        note_id=existing.id,
-                        front=front,
-                        back=back,
-                        tags=tags,
-                        deck_id=deck_obj.id,
+                if existing_digest != _card_digest(front, back, tags):
+                    updates.append(
+                        {"note_id": existing.id, "front": front, "back": back, "tags": tags}
                     )
             else:
                 # New card
-                _client.add_card(deck_id=deck_obj.id, front=front, back=back, tags=tags)
+                adds.append({"front": front, "back": back, "tags": tags})
 
+    _client.bulk_upsert(deck_obj.id, adds=adds, updates=updates)
     _client.sync_up()
     deck_obj.sync()
     return deck_obj
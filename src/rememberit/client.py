@@ -1,34 +1,49 @@
 from __future__ import annotations
 
+import atexit
 import contextlib
+import dataclasses
 import io
 import json
 import os
 import random
 import string
-import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Callable, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import requests
 import zstandard as zstd
-from anki.collection import Collection
-from anki.models import ModelManager
-from anki.notes import Note
-from anki.sync_pb2 import SyncAuth as ProtoSyncAuth
 
-from .config import DEFAULT_CONFIG_DIRNAME
+from .config import DEFAULT_CONFIG_DIRNAME, _json_dumps, _json_loads
 from .models import Card, CardCollection, Deck, DeckCollection
 
+if TYPE_CHECKING:  # pragma: no cover
+    from anki.collection import Collection
+    from anki.models import ModelManager
+    from anki.notes import Note
+
 # Files on disk
 STORE_DIR = Path.home() / DEFAULT_CONFIG_DIRNAME
 COLLECTION_PATH = STORE_DIR / "collection.anki2"
 SESSION_PATH = STORE_DIR / "config.json"
 
 DEFAULT_ENDPOINT = "https://sync.ankiweb.net/"
+ANKIWEB_EDIT_URL_PREFIX = "https://ankiweb.net/edit/"
 SYNC_VERSION = 10
 CLIENT_VERSION = "rememberit,0.1"
+MAX_REDIRECTS = 5
+
+# Shared HTTP session so repeated downloads (and redirect retries) reuse
+# pooled connections instead of redoing DNS + TLS per request.
+_HTTP_SESSION = requests.Session()
+
+# The download request body is always an empty JSON object; compress it once.
+_ZSTD_EMPTY_OBJ: bytes = zstd.ZstdCompressor(level=1).compress(b"{}")
+_ZSTD_DECOMP = zstd.ZstdDecompressor()
 
 
 def _generate_session_key() -> str:
@@ -36,36 +51,85 @@ def _generate_session_key() -> str:
     return "".join(random.choice(chars) for _ in range(8))
 
 
+# Discard buffer reused by _silence_anki instead of allocating two
+# StringIO objects per suppressed call.
+_ANKI_LOG_SINK = io.StringIO()
+
+
+@contextlib.contextmanager
+def _silence_anki() -> Iterator[None]:
+    """Suppress Anki's debug output on stdout/stderr."""
+    _ANKI_LOG_SINK.seek(0)
+    _ANKI_LOG_SINK.truncate()
+    with (
+        contextlib.redirect_stdout(_ANKI_LOG_SINK),
+        contextlib.redirect_stderr(_ANKI_LOG_SINK),
+    ):
+        yield
+
+
 def _close_collection_quiet(col: Collection) -> None:
     """Close collection while suppressing Anki's debug output."""
-    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+    with _silence_anki():
         col.close()
 
 
-def _download_collection(hkey: str, endpoint: str) -> bytes:
-    """Download collection directly from AnkiWeb sync endpoint."""
-    url = endpoint.rstrip("/") + "/sync/download"
+def _download_collection(hkey: str, endpoint: str, dest: Path) -> None:
+    """Stream collection from AnkiWeb sync endpoint straight to dest.
+
+    Collections can run to hundreds of megabytes, so the response is
+    written to disk chunk by chunk (decompressing on the fly when the
+    payload is a zstd frame) instead of being buffered in memory. Chunks
+    go to a ``.part`` sibling first and are renamed onto dest only once
+    the full body has arrived, so a dropped connection never leaves a
+    truncated collection.anki2 behind.
+    """
     session_key = _generate_session_key()
     header = json.dumps({"v": SYNC_VERSION, "k": hkey, "c": CLIENT_VERSION, "s": session_key})
-    body = b"{}"
-    cctx = zstd.ZstdCompressor()
-    compressed: bytes = cctx.compress(body)
-    resp = requests.post(
-        url,
-        data=compressed,
-        headers={"anki-sync": header, "Content-Type": "application/octet-stream"},
-        timeout=120,
-        allow_redirects=False,
-    )
-    if resp.status_code in (307, 308):
-        redirect_url = resp.headers.get("Location", endpoint)
-        return _download_collection(hkey, redirect_url)
-    resp.raise_for_status()
-    data: bytes = resp.content
-    if data[:4] == b"\x28\xb5\x2f\xfd":
-        dctx = zstd.ZstdDecompressor()
-        data = dctx.decompress(data)
-    return data
+    for _ in range(MAX_REDIRECTS + 1):
+        url = endpoint.rstrip("/") + "/sync/download"
+        resp = _HTTP_SESSION.post(
+            url,
+            data=_ZSTD_EMPTY_OBJ,
+            headers={"anki-sync": header, "Content-Type": "application/octet-stream"},
+            timeout=120,
+            allow_redirects=False,
+            stream=True,
+        )
+        if resp.status_code not in (307, 308):
+            break
+        endpoint = resp.headers.get("Location", endpoint)
+        resp.close()
+    else:
+        raise RememberItError(f"Too many sync redirects (>{MAX_REDIRECTS})")
+    try:
+        resp.raise_for_status()
+    except requests.HTTPError:
+        resp.close()
+        raise
+    chunks = resp.iter_content(chunk_size=64 * 1024)
+    # Peek enough bytes to check for the zstd frame magic.
+    head = b""
+    for chunk in chunks:
+        head += chunk
+        if len(head) >= 4:
+            break
+    part = dest.with_name(dest.name + ".part")
+    try:
+        with part.open("wb") as fp:
+            if head[:4] == b"\x28\xb5\x2f\xfd":
+                with _ZSTD_DECOMP.stream_writer(fp, closefd=False) as writer:
+                    writer.write(head)
+                    for chunk in chunks:
+                        writer.write(chunk)
+            else:
+                fp.write(head)
+                for chunk in chunks:
+                    fp.write(chunk)
+    except BaseException:
+        part.unlink(missing_ok=True)
+        raise
+    os.replace(part, dest)
 
 
 class RememberItError(Exception):
@@ -84,9 +148,18 @@ class Session:
 
 def load_session() -> Session | None:
     """Load session from ~/.rememberit/config.json if present."""
-    if not SESSION_PATH.exists():
+    try:
+        mtime_ns = SESSION_PATH.stat().st_mtime_ns
+    except OSError:
         return None
-    raw = json.loads(SESSION_PATH.read_text())
+    # Callers may mutate the result, so hand out a copy of the cached value.
+    return dataclasses.replace(_load_session_cached(str(SESSION_PATH), mtime_ns))
+
+
+@lru_cache(maxsize=4)
+def _load_session_cached(path_str: str, mtime_ns: int) -> Session:
+    """Parse the session file, cached on (path, mtime) so repeat loads are free."""
+    raw = _json_loads(Path(path_str).read_bytes())
     return Session(
         hkey=raw["hkey"],
         endpoint=raw.get("endpoint") or DEFAULT_ENDPOINT,
@@ -98,7 +171,8 @@ def load_session() -> Session | None:
 def save_session(sess: Session) -> Session:
     """Persist session to ~/.rememberit/config.json."""
     SESSION_PATH.parent.mkdir(parents=True, exist_ok=True)
-    SESSION_PATH.write_text(json.dumps(sess.__dict__, indent=2))
+    SESSION_PATH.write_bytes(_json_dumps(sess.__dict__))
+    _load_session_cached.cache_clear()
     try:
         SESSION_PATH.chmod(0o600)
     except PermissionError:
@@ -108,24 +182,15 @@ def save_session(sess: Session) -> Session:
 
 _T = TypeVar("_T")
 
+# Single long-lived worker instead of spawning a fresh thread per backend
+# call; serializing on one worker also keeps collection access ordered.
+_ANKI_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="anki-bg")
+atexit.register(_ANKI_EXECUTOR.shutdown)
+
 
 def _run_in_thread(fn: Callable[[], _T]) -> _T:
     """Run blocking Anki backend calls off the main thread."""
-    result: dict[str, _T] = {}
-    error: dict[str, Exception] = {}
-
-    def wrapper() -> None:
-        try:
-            result["value"] = fn()
-        except Exception as exc:  # noqa: BLE001
-            error["exc"] = exc
-
-    t = threading.Thread(target=wrapper)
-    t.start()
-    t.join()
-    if "exc" in error:
-        raise error["exc"]
-    return result["value"]
+    return _ANKI_EXECUTOR.submit(fn).result()
 
 
 class RememberItClient:
@@ -135,6 +200,8 @@ class RememberItClient:
         self.session = session or load_session()
         self._deck_cache: dict[str, Deck] = {}
         self._deck_order: list[str] = []
+        self._col: Collection | None = None
+        atexit.register(self.close)
 
     # --- Session / sync -------------------------------------------------
     def login(
@@ -146,16 +213,15 @@ class RememberItClient:
         if not user or not pw:
             raise RememberItError("Provide credentials or set ANKI_USER / ANKI_PASS")
 
+        from anki.collection import Collection
+
         STORE_DIR.mkdir(parents=True, exist_ok=True)
         tmp = STORE_DIR / "_login.anki2"
 
         # Suppress Anki's debug output during collection operations
         col = None
         try:
-            with (
-                contextlib.redirect_stdout(io.StringIO()),
-                contextlib.redirect_stderr(io.StringIO()),
-            ):
+            with _silence_anki():
                 col = Collection(str(tmp))
 
                 def _do_login() -> Any:
@@ -165,11 +231,7 @@ class RememberItClient:
         finally:
             # Always close collection, even on error
             if col is not None:
-                with (
-                    contextlib.redirect_stdout(io.StringIO()),
-                    contextlib.redirect_stderr(io.StringIO()),
-                ):
-                    col.close()
+                _close_collection_quiet(col)
             tmp.unlink(missing_ok=True)
         self.session = save_session(
             Session(
@@ -191,18 +253,37 @@ class RememberItClient:
             SESSION_PATH.unlink()
 
     def _ensure_collection(self) -> Collection:
-        """Open local collection; download from AnkiWeb if missing."""
+        """Return the open collection handle, opening (and downloading) on first use.
+
+        The handle is kept open across operations; opening a collection
+        runs schema checks and is far too slow to repeat per call. Use
+        close() (or the context-manager form) to release it.
+        """
+        if self._col is not None:
+            return self._col
         if not self.session:
             raise RememberItError("Not logged in. Call login() first.")
+        from anki.collection import Collection
 
         STORE_DIR.mkdir(parents=True, exist_ok=True)
         exists = COLLECTION_PATH.exists()
         if not exists:
-            data = _download_collection(self.session.hkey, self.session.endpoint)
-            COLLECTION_PATH.write_bytes(data)
-        # Suppress Anki's debug output
-        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
-            return Collection(str(COLLECTION_PATH))
+            _download_collection(self.session.hkey, self.session.endpoint, COLLECTION_PATH)
+        with _silence_anki():
+            self._col = Collection(str(COLLECTION_PATH))
+        return self._col
+
+    def close(self) -> None:
+        """Close the cached collection handle, if open."""
+        if self._col is not None:
+            _close_collection_quiet(self._col)
+            self._col = None
+
+    def __enter__(self) -> RememberItClient:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
 
     def sync_down(self) -> None:
         """Pull latest collection from AnkiWeb."""
@@ -211,19 +292,14 @@ class RememberItClient:
         session = self.session
 
         def _run() -> None:
+            from anki.sync_pb2 import SyncAuth
+
             col = self._ensure_collection()
-            try:
-                # Suppress Anki's debug output
-                with (
-                    contextlib.redirect_stdout(io.StringIO()),
-                    contextlib.redirect_stderr(io.StringIO()),
-                ):
-                    col.sync_collection(
-                        auth=ProtoSyncAuth(hkey=session.hkey, endpoint=session.endpoint),
-                        sync_media=False,
-                    )
-            finally:
-                _close_collection_quiet(col)
+            with _silence_anki():
+                col.sync_collection(
+                    auth=SyncAuth(hkey=session.hkey, endpoint=session.endpoint),
+                    sync_media=False,
+                )
 
         _run_in_thread(_run)
         self._deck_cache.clear()
@@ -238,21 +314,14 @@ class RememberItClient:
         session = self.session
 
         def _run() -> None:
-            col = None
-            try:
-                # Suppress Anki's debug output
-                with (
-                    contextlib.redirect_stdout(io.StringIO()),
-                    contextlib.redirect_stderr(io.StringIO()),
-                ):
-                    col = Collection(str(COLLECTION_PATH))
-                    col.sync_collection(
-                        auth=ProtoSyncAuth(hkey=session.hkey, endpoint=session.endpoint),
-                        sync_media=False,
-                    )
-            finally:
-                if col is not None:
-                    _close_collection_quiet(col)
+            from anki.sync_pb2 import SyncAuth
+
+            col = self._ensure_collection()
+            with _silence_anki():
+                col.sync_collection(
+                    auth=SyncAuth(hkey=session.hkey, endpoint=session.endpoint),
+                    sync_media=False,
+                )
 
         _run_in_thread(_run)
         self._deck_cache.clear()
@@ -278,11 +347,12 @@ class RememberItClient:
         return DeckCollection(ordered, client=self)
 
     def add_card(self, deck_id: int, front: str, back: str, tags: str = "") -> dict[str, Any]:
+        from anki.notes import Note
+
         col = self._ensure_collection()
         mm: ModelManager = col.models
         model = mm.by_name("Basic")
         if not model:
-            _close_collection_quiet(col)
             raise RememberItError("Basic note type not found in collection")
         note = Note(col, model)
         note.fields[0] = front
@@ -290,10 +360,52 @@ class RememberItClient:
         if tags:
             note.tags = tags.split()
         col.add_note(note, deck_id=deck_id)  # type: ignore[arg-type]
-        _close_collection_quiet(col)
+        self._patch_cache_add(deck_id, note, front, back)
+        return {"status_code": 200}
+
+    def add_cards(self, deck_id: int, cards: list[dict[str, str]]) -> dict[str, Any]:
+        """Add many cards in one collection open/close.
+
+        Each entry is a dict with "front" and "back" keys and an optional
+        "tags" string. Much faster than repeated add_card calls, which
+        reopen the collection per note.
+        """
+        col = self._ensure_collection()
+        self._add_notes(col, deck_id, cards)
         self._deck_cache.clear()
         self._deck_order = []
-        return {"status_code": 200}
+        return {"status_code": 200, "added": len(cards)}
+
+    def bulk_upsert(
+        self,
+        deck_id: int,
+        adds: list[dict[str, str]],
+        updates: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Apply many adds and updates in one collection open/close.
+
+        adds entries are front/back/tags dicts (as for add_cards);
+        updates entries additionally carry a "note_id". The deck cache is
+        cleared once at the end rather than per operation.
+        """
+        if not adds and not updates:
+            return {"status_code": 200, "added": 0, "updated": 0}
+        col = self._ensure_collection()
+        for entry in updates:
+            note = col.get_note(entry["note_id"])
+            if not note:
+                raise RememberItError(f"Note not found: {entry['note_id']}")
+            note.fields[0] = entry.get("front", "")
+            note.fields[1] = entry.get("back", "")
+            tags = entry.get("tags", "")
+            if tags:
+                note.tags = tags.split()
+            col.update_note(note)
+        if adds:
+            self._add_notes(col, deck_id, adds)
+        self._deck_cache.clear()
+        self._deck_order = []
+        return {"status_code": 200, "added": len(adds), "updated": len(updates)}
 
     def update_card(
         self,
@@ -306,17 +418,91 @@ class RememberItClient:
         col = self._ensure_collection()
         note = col.get_note(note_id)  # type: ignore[arg-type]
         if not note:
-            _close_collection_quiet(col)
             raise RememberItError(f"Note not found: {note_id}")
         note.fields[0] = front
         note.fields[1] = back
         if tags:
             note.tags = tags.split()
         col.update_note(note)
-        _close_collection_quiet(col)
+        self._patch_cache_update(note_id, front, back, "\x1f".join(note.fields))
+        return {"status_code": 200}
+
+    def _add_notes(self, col: Collection, deck_id: int, entries: list[dict[str, str]]) -> None:
+        """Build Basic notes from front/back/tags dicts and add them to a deck.
+
+        Shared note-building loop for add_cards and bulk_upsert so the two
+        code paths cannot drift apart.
+        """
+        from anki.notes import Note
+
+        mm: ModelManager = col.models
+        model = mm.by_name("Basic")
+        if not model:
+            raise RememberItError("Basic note type not found in collection")
+        for entry in entries:
+            note = Note(col, model)
+            note.fields[0] = entry.get("front", "")
+            note.fields[1] = entry.get("back", "")
+            tags = entry.get("tags", "")
+            if tags:
+                note.tags = tags.split()
+            col.add_note(note, deck_id=deck_id)  # type: ignore[arg-type]
+
+    @staticmethod
+    def _bump_deck_counts(deck: Deck, delta: int) -> None:
+        """Adjust the totals shown by deck tables after an in-place cache patch."""
+        counts = dict(deck.counts)
+        for key in ("total", "total_incl_children"):
+            value = counts.get(key)
+            if isinstance(value, int):
+                counts[key] = value + delta
+        deck.counts = counts
+
+    def _patch_cache_add(self, deck_id: int, note: Note, front: str, back: str) -> None:
+        """Append the new card to the cached deck rather than dropping the cache.
+
+        Falls back to a full clear when the target deck is not cached.
+        """
+        for deck in self._deck_cache.values():
+            if deck.id == deck_id:
+                card = Card(
+                    id=note.id,
+                    front=front,
+                    back=back,
+                    raw_text="\x1f".join(note.fields),
+                    edit_url=ANKIWEB_EDIT_URL_PREFIX + str(note.id),
+                    deck=deck,
+                    _client=self,
+                )
+                deck.cards.append(card)
+                self._bump_deck_counts(deck, 1)
+                return
+        self._deck_cache.clear()
+        self._deck_order = []
+
+    def _patch_cache_update(self, note_id: int, front: str, back: str, raw_text: str) -> None:
+        """Update the cached card in place rather than dropping the cache.
+
+        Only decks whose cards have already been materialized are probed
+        (through their by_id index); scanning lazy decks would force every
+        loader to run just to update one card. Falls back to a full clear
+        when the card is not found there, which also covers the case where
+        it lives in a still-lazy deck holding pre-update rows.
+        """
+        key = str(note_id)
+        for deck in self._deck_cache.values():
+            if deck.cards._loader is not None:
+                continue
+            card = deck.cards.by_id().get(key)
+            if card is not None:
+                card.front = front
+                card.back = back
+                card.raw_text = raw_text
+                # front changed under the collection's lazy indexes
+                deck.cards._invalidate()
+                return
         self._deck_cache.clear()
         self._deck_order = []
-        return {"status_code": 200}
 
     def create_deck(self, name: str) -> Deck:
         col = self._ensure_collection()
@@ -335,14 +521,12 @@ class RememberItClient:
                     front=front,
                     back=back,
                     raw_text="\x1f".join(note.fields),
-                    edit_url=None,
+                    edit_url=ANKIWEB_EDIT_URL_PREFIX + str(note.id),
                     deck=None,
                     _client=self,
                 )
             )
 
-        _close_collection_quiet(col)
-
         deck_row = {
             "id": deck_id,
             "name": name,
@@ -371,7 +555,6 @@ class RememberItClient:
             deck_obj = decks[deck]
         col = self._ensure_collection()
         col.decks.remove([deck_obj.id])
-        _close_collection_quiet(col)
         self._deck_cache.pop(self._deck_key_from_deck(deck_obj), None)
         self._deck_order = [k for k in self._deck_order if k != self._deck_key_from_deck(deck_obj)]
         return {"status_code": 200}
@@ -384,7 +567,6 @@ class RememberItClient:
             deck_obj = decks[deck]
         col = self._ensure_collection()
         col.decks.rename(deck_obj.id, new_name)
-        _close_collection_quiet(col)
         # Update cache
         old_key = self._deck_key_from_deck(deck_obj)
         deck_obj.name = new_name
@@ -398,27 +580,19 @@ class RememberItClient:
     # --- Internal helpers -----------------------------------------------
     def _refresh_cache_from_collection(self) -> None:
         col = self._ensure_collection()
+        # One SQL pass over every card instead of a find_cards + get_card
+        # round trip through the backend per deck per card.
+        rows = col.db.all(  # type: ignore[union-attr]
+            "SELECT c.did, n.id, n.flds FROM cards c JOIN notes n ON c.nid = n.id"
+        )
+        rows_by_did: dict[int, list[tuple[int, str]]] = {}
+        for did, nid, flds in rows:
+            rows_by_did.setdefault(did, []).append((nid, flds))
         decks: list[Deck] = []
         for deck_info in col.decks.all_names_and_ids():
             deck_id = deck_info.id
             name = deck_info.name
-            cards: list[Card] = []
-            for cid in col.find_cards(f'deck:"{name}"'):
-                card_obj = col.get_card(cid)
-                note = card_obj.note()
-                front = note.fields[0] if len(note.fields) > 0 else ""
-                back = note.fields[1] if len(note.fields) > 1 else ""
-                cards.append(
-                    Card(
-                        id=note.id,
-                        front=front,
-                        back=back,
-                        raw_text="\x1f".join(note.fields),
-                        edit_url=None,
-                        deck=None,
-                        _client=self,
-                    )
-                )
+            cards = rows_by_did.get(deck_id, [])
             deck_row = {
                 "id": deck_id,
                 "name": name,
@@ -430,14 +604,37 @@ class RememberItClient:
                 "total_incl_children": len(cards),
             }
             deck_obj = Deck.from_row(deck_row, client=self)
-            deck_obj.cards = CardCollection(cards)
-            for card in deck_obj.cards:
-                card.deck = deck_obj
+            # Card objects are built lazily, on first access to the deck's
+            # cards; len() is answered from the row count without loading.
+            deck_obj.cards = CardCollection(
+                loader=partial(self._build_cards, deck_obj, cards),
+                count=len(cards),
+            )
             decks.append(deck_obj)
-        _close_collection_quiet(col)
         self._deck_cache = {self._deck_key_from_deck(d): d for d in decks}
         self._deck_order = [self._deck_key_from_deck(d) for d in decks]
 
+    def _build_cards(self, deck: Deck, rows: list[tuple[int, str]]) -> list[Card]:
+        """Turn (note id, fields) rows into Card objects for a deck."""
+        cards: list[Card] = []
+        for nid, flds in rows:
+            # Only the first two fields are used; don't split the rest.
+            fields = flds.split("\x1f", 2)
+            front = fields[0] if len(fields) > 0 else ""
+            back = fields[1] if len(fields) > 1 else ""
+            cards.append(
+                Card(
+                    id=nid,
+                    front=front,
+                    back=back,
+                    raw_text=flds,
+                    edit_url=ANKIWEB_EDIT_URL_PREFIX + str(nid),
+                    deck=deck,
+                    _client=self,
+                )
+            )
+        return cards
+
     def _deck_key_from_deck(self, deck: Deck) -> str:
         return str(deck.path or deck.name or deck.id or "")
 
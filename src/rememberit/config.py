@@ -2,10 +2,16 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:  # orjson is optional; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 DEFAULT_CONFIG_DIRNAME = ".rememberit"
 DEFAULT_CONFIG_FILENAME = "settings.json"
 ENV_CONFIG_DIR = "REMEMBERIT_CONFIG_DIR"
@@ -24,6 +30,20 @@ class Settings:
     display_format: str = "table"
 
 
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to 2-space-indented JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
 def _config_dir() -> Path:
     """Resolve the config directory, allowing override for tests via env."""
     override = os.getenv(ENV_CONFIG_DIR)
@@ -36,14 +56,21 @@ def config_path() -> Path:
 
 def load_settings(path: Path | None = None) -> Settings:
     target = path or config_path()
-    if not target.exists():
+    try:
+        mtime_ns = target.stat().st_mtime_ns
+    except OSError:
         return Settings()
+    # Callers may mutate the result, so hand out a copy of the cached value.
+    return replace(_load_settings_cached(str(target), mtime_ns))
+
 
-    with target.open("r", encoding="utf-8") as fh:
-        try:
-            raw: dict[str, Any] = json.load(fh)
-        except json.JSONDecodeError:
-            return Settings()
+@lru_cache(maxsize=8)
+def _load_settings_cached(target_str: str, mtime_ns: int) -> Settings:
+    """Parse the settings file, cached on (path, mtime) so repeat loads are free."""
+    try:
+        raw: dict[str, Any] = _json_loads(Path(target_str).read_bytes())
+    except (OSError, ValueError):  # covers json.JSONDecodeError and orjson's equivalent
+        return Settings()
 
     return Settings(
         email=raw.get("email", ""),
@@ -61,9 +88,8 @@ def load_settings(path: Path | None = None) -> Settings:
 def save_settings(settings: Settings, path: Path | None = None) -> Path:
     target = path or config_path()
     target.parent.mkdir(parents=True, exist_ok=True)
-    data = asdict(settings)
-    with target.open("w", encoding="utf-8") as fh:
-        json.dump(data, fh, indent=2)
+    target.write_bytes(_json_dumps(asdict(settings)))
+    _load_settings_cached.cache_clear()
     try:
         target.chmod(0o600)
     except PermissionError:
@@ -10,24 +10,31 @@ Usage:
 
 from __future__ import annotations
 
+import copy
+from functools import cache, lru_cache
 from pathlib import Path
+from typing import Any
 
 from .formatting import SUPPORTED_LANGUAGES, format_code, format_image, format_question
 
-CODE_EXAMPLES: dict[str, str] = {
-    "python": '''def fibonacci(n: int) -> int:
+
+@cache
+def _code_examples() -> dict[str, str]:
+    """Build the per-language snippet table on first use."""
+    return {
+        "python": '''def fibonacci(n: int) -> int:
     """Calculate the nth Fibonacci number."""
     if n <= 1:
         return n
     return fibonacci(n - 1) + fibonacci(n - 2)''',
-    "javascript": """function debounce(fn, delay) {
+        "javascript": """function debounce(fn, delay) {
     let timeoutId;
     return function (...args) {
         clearTimeout(timeoutId);
         timeoutId = setTimeout(() => fn.apply(this, args), delay);
     };
 }""",
-    "typescript": """interface User {
+        "typescript": """interface User {
     id: number;
     name: string;
     email: string;
@@ -37,7 +44,7 @@ const getUser = async (id: number): Promise<User> => {
     const response = await fetch(`/api/users/${id}`);
     return response.json();
 };""",
-    "html": """<!DOCTYPE html>
+        "html": """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -47,7 +54,7 @@ const getUser = async (id: number): Promise<User> => {
     <h1>Welcome!</h1>
 </body>
 </html>""",
-    "css": """.card {
+        "css": """.card {
     display: flex;
     flex-direction: column;
     padding: 1.5rem;
@@ -55,7 +62,7 @@ const getUser = async (id: number): Promise<User> => {
     background: linear-gradient(135deg, #667eea, #764ba2);
     box-shadow: 0 4px 20px rgba(0, 0, 0, 0.15);
 }""",
-    "sql": """SELECT
+        "sql": """SELECT
     users.name,
     COUNT(orders.id) AS order_count,
     SUM(orders.total) AS total_spent
@@ -65,13 +72,13 @@ WHERE orders.created_at >= DATE_SUB(NOW(), INTERVAL 30 DAY)
 GROUP BY users.id
 HAVING order_count > 5
 ORDER BY total_spent DESC;""",
-    "bash": """#!/bin/bash
+        "bash": """#!/bin/bash
 # Find and replace in all Python files
 find . -name "*.py" -type f | while read file; do
     sed -i '' 's/old_function/new_function/g' "$file"
     echo "Processed: $file"
 done""",
-    "json": """{
+        "json": """{
     "name": "rememberit",
     "version": "0.1.0",
     "dependencies": {
@@ -81,7 +88,7 @@ done""",
         "test": "pytest"
     }
 }""",
-    "yaml": """name: CI Pipeline
+        "yaml": """name: CI Pipeline
 on: [push, pull_request]
 jobs:
   test:
@@ -90,14 +97,14 @@ jobs:
       - uses: actions/checkout@v4
       - name: Run tests
         run: pytest --cov""",
-    "rust": """fn main() {
+        "rust": """fn main() {
     let numbers: Vec<i32> = (1..=10).collect();
     let sum: i32 = numbers.iter()
         .filter(|&x| x % 2 == 0)
         .sum();
     println!("Sum of evens: {}", sum);
 }""",
-    "go": """package main
+        "go": """package main
 
 import "fmt"
 
@@ -113,7 +120,7 @@ func main() {
         fmt.Println(n)
     }
 }""",
-    "swift": """struct ContentView: View {
+        "swift": """struct ContentView: View {
     @State private var count = 0
 
     var body: some View {
@@ -126,9 +133,22 @@ func main() {
         }
     }
 }""",
-}
+    }
+
+
+def __getattr__(name: str) -> Any:
+    # Back-compat: CODE_EXAMPLES used to be a module constant; keep the name
+    # working without paying for the snippet table at import time.
+    if name == "CODE_EXAMPLES":
+        return _code_examples()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+QUESTION_THEMES = ("gradient", "dark", "light", "blue", "purple", "green", "orange")
 
-QUESTION_THEMES = ["gradient", "dark", "light", "blue", "purple", "green", "orange"]
+# The supported-language banner never changes; join it once at import.
+_SUPPORTED_LANGUAGES_TEXT = ", ".join(SUPPORTED_LANGUAGES)
 
 SAMPLE_QUESTIONS = [
     "What is the time complexity of binary search?",
@@ -150,14 +170,17 @@ def _styled_html(html: str) -> None:
 
 def code() -> None:
     """Display syntax-highlighted code examples for all supported languages."""
-    _styled_html("<h2>📝 Code Formatting Examples</h2>")
-    _styled_html(f"<p><b>Supported languages:</b> {', '.join(SUPPORTED_LANGUAGES)}</p>")
-    _styled_html("<hr/>")
-
-    for lang, snippet in CODE_EXAMPLES.items():
-        _styled_html(f"<h3>{lang}</h3>")
-        _styled_html(format_code(snippet, language=lang))
-        _styled_html("<br/>")
+    parts = [
+        "<h2>📝 Code Formatting Examples</h2>",
+        f"<p><b>Supported languages:</b> {_SUPPORTED_LANGUAGES_TEXT}</p>",
+        "<hr/>",
+    ]
+    for lang, snippet in _code_examples().items():
+        parts.append(f"<h3>{lang}</h3>")
+        parts.append(format_code(snippet, language=lang))
+        parts.append("<br/>")
+    # One display() call instead of ~40: the notebook renders a single blob.
+    _styled_html("".join(parts))
 
 
 def questions() -> None:
@@ -191,62 +214,76 @@ def images() -> None:
     )
 
     # Bundled photo (image/pickles.jpg)
-    pickles_path = _find_pickles_image()
-    if pickles_path:
+    pickles_html = _pickles_html()
+    if pickles_html:
         _styled_html("<h3>Bundled example (pickles.jpg)</h3>")
-        _styled_html(format_image(pickles_path, alt="Pickles the dog"))
+        _styled_html(pickles_html)
     else:
         _styled_html("<p><i>Pickles image not found.</i></p>")
 
 
-def deck_example() -> dict[str, object]:
-    """
-    Return an example deck dict with code and styled question cards.
-
-    This can be passed directly to rememberit.upsert_deck().
-    """
-    return {
-        "name": "Python Examples",
-        "cards": [
-            {
-                "front": "What is a list comprehension?",
-                "front_type": "card",
-                "front_theme": "gradient",
-                "back": "[x**2 for x in range(10)]",
-                "back_type": "code",
-                "back_lang": "python",
-            },
-            {
-                "front": "Write a function to check if a number is prime",
-                "front_type": "card",
-                "front_theme": "purple",
-                "back": """def is_prime(n: int) -> bool:
+# Built once; deck_example hands out copies so callers can edit freely.
+_DECK_EXAMPLE: dict[str, object] = {
+    "name": "Python Examples",
+    "cards": [
+        {
+            "front": "What is a list comprehension?",
+            "front_type": "card",
+            "front_theme": "gradient",
+            "back": "[x**2 for x in range(10)]",
+            "back_type": "code",
+            "back_lang": "python",
+        },
+        {
+            "front": "Write a function to check if a number is prime",
+            "front_type": "card",
+            "front_theme": "purple",
+            "back": """def is_prime(n: int) -> bool:
     if n < 2:
         return False
     for i in range(2, int(n**0.5) + 1):
         if n % i == 0:
             return False
     return True""",
-                "back_type": "code",
-                "back_lang": "python",
-            },
-            {
-                "front": "How do you create a dictionary from two lists?",
-                "front_type": "card",
-                "front_theme": "blue",
-                "back": """keys = ['a', 'b', 'c']
+            "back_type": "code",
+            "back_lang": "python",
+        },
+        {
+            "front": "How do you create a dictionary from two lists?",
+            "front_type": "card",
+            "front_theme": "blue",
+            "back": """keys = ['a', 'b', 'c']
 values = [1, 2, 3]
 result = dict(zip(keys, values))
 # {'a': 1, 'b': 2, 'c': 3}""",
-                "back_type": "code",
-                "back_lang": "python",
-            },
-        ],
-    }
+            "back_type": "code",
+            "back_lang": "python",
+        },
+    ],
+}
+
+
+def deck_example() -> dict[str, object]:
+    """
+    Return an example deck dict with code and styled question cards.
+
+    This can be passed directly to rememberit.upsert_deck().
+    """
+    return copy.deepcopy(_DECK_EXAMPLE)
+
+
+@lru_cache(maxsize=1)
+def _pickles_html() -> str | None:
+    """Render the bundled example image once; the base64 embed never changes."""
+    path = _find_pickles_image()
+    if not path:
+        return None
+    return format_image(path, alt="Pickles the dog")
 
 
+@lru_cache(maxsize=1)
 def _find_pickles_image() -> Path | None:
-    """Locate bundled pickles.jpg (installed or editable)."""
+    """Locate bundled pickles.jpg (installed or editable); the probe is cached."""
     candidates = [
         Path(__file__).resolve().parent / "image" / "pickles.jpg",  # packaged path
         Path(__file__).resolve().parent.parent / "image" / "pickles.jpg",
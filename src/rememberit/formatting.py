@@ -11,20 +11,47 @@ import random
 import re
 import textwrap
 from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache
 from typing import Any
 
-_PYGMENTS_AVAILABLE = False
-try:
-    from pygments import highlight  # type: ignore[import-untyped]
-    from pygments.formatters import HtmlFormatter  # type: ignore[import-untyped]
-    from pygments.lexers import get_lexer_by_name  # type: ignore[import-untyped]
+# Pygments is imported on first use rather than at module import: it pulls
+# in its whole plugin machinery, and most sessions never format a code card.
+# The names it provides start as None and are rebound by _load_pygments.
+_PYGMENTS_AVAILABLE: bool | None = None
+highlight: Any = None
+get_lexer_by_name: Any = None
+_HTML_FORMATTER: Any = None
 
-    _PYGMENTS_AVAILABLE = True
-except ImportError:
-    pass
+
+def _load_pygments() -> bool:
+    """Import Pygments lazily; returns whether highlighting is available."""
+    global _PYGMENTS_AVAILABLE, highlight, get_lexer_by_name, _HTML_FORMATTER
+    if _PYGMENTS_AVAILABLE is None:
+        try:
+            from pygments import highlight  # type: ignore[import-untyped]
+            from pygments.formatters import HtmlFormatter  # type: ignore[import-untyped]
+            from pygments.lexers import get_lexer_by_name  # type: ignore[import-untyped]
+        except ImportError:
+            _PYGMENTS_AVAILABLE = False
+        else:
+            # One formatter for all cards: the configuration never varies, and
+            # constructing an HtmlFormatter resolves the full monokai style table.
+            _HTML_FORMATTER = HtmlFormatter(
+                noclasses=True,
+                style="monokai",
+                nowrap=False,
+                prestyles=(
+                    "background:#272822; color:#f8f8f2; padding:16px 20px; "
+                    "border-radius:12px; font-family:'Fira Code','SF Mono',Consolas,"
+                    "'Liberation Mono',Menlo,monospace; font-size:18px; "
+                    "line-height:1.6; white-space:pre-wrap; word-wrap:break-word;"
+                ),
+            )
+            _PYGMENTS_AVAILABLE = True
+    return _PYGMENTS_AVAILABLE
 
 
-SUPPORTED_LANGUAGES = [
+SUPPORTED_LANGUAGES = (
     "python",
     "javascript",
     "typescript",
@@ -50,7 +77,12 @@ SUPPORTED_LANGUAGES = [
     "lua",
     "perl",
     "markdown",
-]
+)
+
+# Single-pass HTML escaping; the chained .replace() version walked the
+# string four times.
+_HTML_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+_NEEDS_ESCAPE_RE = re.compile(r'[&<>"]')
 
 _PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
 _JPEG_MAGIC = b"\xff\xd8\xff"
@@ -58,6 +90,12 @@ _GIF87_MAGIC = b"GIF87a"
 _GIF89_MAGIC = b"GIF89a"
 
 
+@lru_cache(maxsize=128)
+def _source_for(func: Callable[..., Any]) -> str:
+    """inspect.getsource + dedent, cached per callable (getsource re-reads the file)."""
+    return textwrap.dedent(inspect.getsource(func))
+
+
 def extract_source(func: Callable[..., Any]) -> str:
     """
     Extract source code from a function or callable object.
@@ -72,12 +110,28 @@ def extract_source(func: Callable[..., Any]) -> str:
         TypeError: If source cannot be extracted
     """
     try:
-        source = inspect.getsource(func)
-        return textwrap.dedent(source)
+        return _source_for(func)
     except (TypeError, OSError) as e:
         raise TypeError(f"Cannot extract source from {func}: {e}") from e
 
 
+@lru_cache(maxsize=64)
+def _get_lexer(language: str) -> Any:
+    """Cached Pygments lexer lookup; lexer objects are reusable across calls."""
+    return get_lexer_by_name(language, stripall=True)
+
+
+@lru_cache(maxsize=256)
+def _highlight_cached(code: str, language: str) -> str:
+    """Highlight code, memoized on (code, language).
+
+    Decks are routinely re-upserted with mostly unchanged cards, so the
+    same snippets come through repeatedly.
+    """
+    result: str = highlight(code, _get_lexer(language), _HTML_FORMATTER)
+    return result
+
+
 def format_code(code: str | Callable[..., Any], language: str = "python") -> str:
     """
     Format code as HTML with syntax highlighting for Anki cards.
@@ -102,25 +156,11 @@ def format_code(code: str | Callable[..., Any], language: str = "python") -> str
         code = extract_source(code)
 
     # Store original for data attribute
-    escaped_content = (
-        code.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
-    )
+    escaped_content = _escape_html_attr(code)
 
-    if _PYGMENTS_AVAILABLE:
+    if _load_pygments():
         try:
-            lexer = get_lexer_by_name(language, stripall=True)
-            formatter = HtmlFormatter(
-                noclasses=True,
-                style="monokai",
-                nowrap=False,
-                prestyles=(
-                    "background:#272822; color:#f8f8f2; padding:16px 20px; "
-                    "border-radius:12px; font-family:'Fira Code','SF Mono',Consolas,"
-                    "'Liberation Mono',Menlo,monospace; font-size:18px; "
-                    "line-height:1.6; white-space:pre-wrap; word-wrap:break-word;"
-                ),
-            )
-            highlighted: str = highlight(code, lexer, formatter)
+            highlighted = _highlight_cached(code, language)
             return (
                 f'<div data-ri-type="code" data-ri-lang="{language}">'
                 f'<div data-ri-content="{escaped_content}"></div>'
@@ -178,6 +218,42 @@ CARD_THEMES = {
 }
 
 
+# Stable tuple for random.choice; rebuilt list(CARD_THEMES.keys()) per call before.
+_THEME_NAMES = tuple(CARD_THEMES)
+
+# Theme-dependent style text, interpolated once at import instead of per call.
+# Per-theme (prefix, mid) card fragments: the rendered card is
+# prefix + escaped + mid + escaped + _CARD_SUFFIX, so format_question is
+# two concatenations instead of re-interpolating the whole template.
+_THEME_PARTS = {
+    name: (
+        f'<div data-ri-type="card" data-ri-theme="{name}"><div data-ri-content="',
+        f""""></div><div style="
+display: flex;
+align-items: center;
+justify-content: center;
+min-height: 200px;
+padding: 40px 30px;
+background: {t["bg"]};
+border-radius: 16px;
+box-shadow: {t["shadow"]};
+">
+<div style="
+color: {t["color"]};
+font-family: system-ui, -apple-system, 'Segoe UI', Roboto, sans-serif;
+font-size: 28px;
+font-weight: 600;
+text-align: center;
+line-height: 1.4;
+text-shadow: 0 2px 4px rgba(0,0,0,0.1);
+">""",
+    )
+    for name, t in CARD_THEMES.items()
+}
+
+_CARD_SUFFIX = "</div>\n</div></div>"
+
+
 def format_question(text: str, theme: str = "random") -> str:
     """
     Format a question as a styled HTML card for Anki.
@@ -194,44 +270,28 @@ def format_question(text: str, theme: str = "random") -> str:
     Returns:
         HTML string with styled question card
     """
-    escaped = (
-        text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
-    )
+    escaped = _escape_html_attr(text)
 
     actual_theme = theme
     if actual_theme == "random":
-        actual_theme = random.choice(list(CARD_THEMES.keys()))
-
-    t = CARD_THEMES.get(actual_theme, CARD_THEMES["gradient"])
-
-    wrapper_open = f'<div data-ri-type="card" data-ri-theme="{actual_theme}">'
-    content_div = f'<div data-ri-content="{escaped}"></div>'
-    return f"""{wrapper_open}{content_div}<div style="
-display: flex;
-align-items: center;
-justify-content: center;
-min-height: 200px;
-padding: 40px 30px;
-background: {t["bg"]};
-border-radius: 16px;
-box-shadow: {t["shadow"]};
-">
-<div style="
-color: {t["color"]};
-font-family: system-ui, -apple-system, 'Segoe UI', Roboto, sans-serif;
-font-size: 28px;
-font-weight: 600;
-text-align: center;
-line-height: 1.4;
-text-shadow: 0 2px 4px rgba(0,0,0,0.1);
-">{escaped}</div>
-</div></div>"""
+        actual_theme = random.choice(_THEME_NAMES)
+
+    parts = _THEME_PARTS.get(actual_theme)
+    if parts is None:
+        # Unknown theme: gradient styling, but keep the requested name in the
+        # data attribute so reverse parsing round-trips.
+        _, mid = _THEME_PARTS["gradient"]
+        prefix = f'<div data-ri-type="card" data-ri-theme="{actual_theme}"><div data-ri-content="'
+    else:
+        prefix, mid = parts
+    return f"{prefix}{escaped}{mid}{escaped}{_CARD_SUFFIX}"
 
 
 def _escape_html_attr(value: str) -> str:
-    return (
-        value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
-    )
+    # Most fields contain no markup; skip the translate copy when clean.
+    if _NEEDS_ESCAPE_RE.search(value) is None:
+        return value
+    return value.translate(_HTML_ESCAPES)
 
 
 def _guess_mime_from_bytes(data: bytes, fallback: str = "image/png") -> str:
@@ -501,13 +561,24 @@ def decks_markdown_table(flat_decks: Iterable[Mapping[str, object]]) -> str:
     Expected keys: id, path, new, learn, review, total, total_incl_children.
     """
     headers = ["id", "path", "new", "learn", "review", "total", "total_incl_children"]
-    lines = [
-        "|" + "|".join(headers) + "|",
-        "|" + "|".join("---" for _ in headers) + "|",
-    ]
-    for row in flat_decks:
-        lines.append("|" + "|".join(str(row.get(col, "")) for col in headers) + "|")
-    return "\n".join(lines)
+    return "\n".join(
+        (
+            "|" + "|".join(headers) + "|",
+            "|" + "|".join("---" for _ in headers) + "|",
+            *("|" + "|".join(str(row.get(col, "")) for col in headers) + "|" for row in flat_decks),
+        )
+    )
+
+
+# Precompiled patterns for parse_card_field; it runs once per field when
+# exporting whole decks.
+_RE_TYPE = re.compile(r'data-ri-type="([^"]+)"')
+_RE_CONTENT = re.compile(r'data-ri-content="([^"]*)"')
+_RE_LANG = re.compile(r'data-ri-lang="([^"]+)"')
+_RE_THEME = re.compile(r'data-ri-theme="([^"]+)"')
+_RE_MIME = re.compile(r'data-ri-mime="([^"]+)"')
+_RE_BYTES = re.compile(r'data-ri-bytes="([^"]+)"')
+_RE_TAG = re.compile(r"<[^>]+>")
 
 
 def parse_card_field(html: str) -> dict[str, str]:
@@ -526,10 +597,10 @@ def parse_card_field(html: str) -> dict[str, str]:
         - For plain/unknown: {content, type="plain"}
     """
     # Check for data-ri-type attribute
-    type_match = re.search(r'data-ri-type="([^"]+)"', html)
+    type_match = _RE_TYPE.search(html)
     if not type_match:
         # Plain text or unknown format - strip all HTML tags
-        plain = re.sub(r"<[^>]+>", "", html)
+        plain = _RE_TAG.sub("", html)
         plain = (
             plain.replace("&amp;", "&")
             .replace("&lt;", "<")
@@ -541,7 +612,7 @@ def parse_card_field(html: str) -> dict[str, str]:
     field_type = type_match.group(1)
 
     # Extract content from data-ri-content attribute
-    content_match = re.search(r'data-ri-content="([^"]*)"', html)
+    content_match = _RE_CONTENT.search(html)
     if content_match:
         content = content_match.group(1)
         # Unescape HTML entities
@@ -553,25 +624,25 @@ def parse_card_field(html: str) -> dict[str, str]:
         )
     else:
         # Fallback: strip HTML
-        content = re.sub(r"<[^>]+>", "", html).strip()
+        content = _RE_TAG.sub("", html).strip()
 
     result: dict[str, str] = {"content": content, "type": field_type}
 
     if field_type == "code":
-        lang_match = re.search(r'data-ri-lang="([^"]+)"', html)
+        lang_match = _RE_LANG.search(html)
         if lang_match:
             result["lang"] = lang_match.group(1)
 
     elif field_type == "card":
-        theme_match = re.search(r'data-ri-theme="([^"]+)"', html)
+        theme_match = _RE_THEME.search(html)
         if theme_match:
             result["theme"] = theme_match.group(1)
 
     elif field_type == "image":
-        mime_match = re.search(r'data-ri-mime="([^"]+)"', html)
+        mime_match = _RE_MIME.search(html)
         if mime_match:
             result["mime"] = mime_match.group(1)
-        size_match = re.search(r'data-ri-bytes="([^"]+)"', html)
+        size_match = _RE_BYTES.search(html)
         if size_match:
             result["bytes"] = size_match.group(1)
 
@@ -1,18 +1,120 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Iterable, Mapping
+import sys
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, SupportsIndex, overload
 
+try:  # optional speedup: orjson serializes straight to UTF-8 bytes in C
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
 from .formatting import decks_markdown_table, parse_card_field
 
 if TYPE_CHECKING:  # pragma: no cover
     from .client import RememberItClient
 
-
-@dataclass
+# Interned card-dict keys: to_dict/save_json build one dict per card, and
+# interned keys make those inserts and later lookups pointer comparisons.
+_K_FRONT = sys.intern("front")
+_K_BACK = sys.intern("back")
+_K_FRONT_TYPE = sys.intern("front_type")
+_K_FRONT_LANG = sys.intern("front_lang")
+_K_FRONT_THEME = sys.intern("front_theme")
+_K_BACK_TYPE = sys.intern("back_type")
+_K_BACK_LANG = sys.intern("back_lang")
+_K_BACK_THEME = sys.intern("back_theme")
+_K_NOTE_ID = sys.intern("note_id")
+_K_TAGS = sys.intern("tags")
+
+# Deck-list table layout is fixed; build the header row once. Full rows
+# come out of itemgetter in one C call; sparse rows fall back to .get.
+_DECK_LIST_HEADERS = ("id", "path", "new", "learn", "review", "total", "total_incl_children")
+_DECK_LIST_HEADER_ROW = "<tr>" + "".join(f"<th>{h}</th>" for h in _DECK_LIST_HEADERS) + "</tr>"
+_DECK_LIST_ROW_TMPL = "<tr>" + "<td>{}</td>" * len(_DECK_LIST_HEADERS) + "</tr>"
+_deck_row_get = itemgetter(*_DECK_LIST_HEADERS)
+
+_DECK_COLL_HEADER_ROW = "<tr><th>id</th><th>path</th><th>cards</th></tr>"
+_DECK_COLL_ROW_TMPL = "<tr><td>{}</td><td>{}</td><td>{}</td></tr>"
+
+# genanki models are deterministic from their id; reuse them across
+# save_apkg calls in a batch export session.
+_GENANKI_MODEL_CACHE: dict[int, Any] = {}
+
+# Card table fragments: the cell styles never change, so the per-row
+# template is formatted with just the three field values.
+_CARD_TABLE_HEADER = (
+    "<tr><th style='padding:8px;border:1px solid #444;'>id</th>"
+    "<th style='padding:8px;border:1px solid #444;'>front</th>"
+    "<th style='padding:8px;border:1px solid #444;'>back</th></tr>"
+)
+_CARD_ROW_TMPL = (
+    "<tr><td style='padding:8px;border:1px solid #444;vertical-align:top;'>{}</td>"
+    "<td style='padding:8px;border:1px solid #444;vertical-align:top;'>{}</td>"
+    "<td style='padding:8px;border:1px solid #444;vertical-align:top;'>{}</td></tr>"
+)
+
+
+# Precompiled repr templates: one format_map call per render instead of
+# concatenating adjacent f-strings.
+_OP_REPR_TMPL = "<div>{message}</div>"
+_CARD_REPR_TMPL = (
+    "<table>"
+    "<thead><tr><th>field</th><th>value</th></tr></thead>"
+    "<tbody>"
+    "<tr><td>id</td><td>{id}</td></tr>"
+    "<tr><td>front</td><td>{front}</td></tr>"
+    "<tr><td>back</td><td>{back}</td></tr>"
+    "<tr><td>deck</td><td>{deck}</td></tr>"
+    "</tbody></table>"
+)
+_SUMMARY_REPR_TMPL = (
+    "<table>"
+    "<thead><tr><th>field</th><th>value</th></tr></thead>"
+    "<tbody>"
+    "<tr><td>id</td><td>{id}</td></tr>"
+    "<tr><td>edit</td><td>{edit}</td></tr>"
+    "<tr><td>text</td><td>{text}</td></tr>"
+    "</tbody></table>"
+)
+_DECK_REPR_TMPL = (
+    "<table>"
+    "<thead><tr><th colspan='2'>Deck</th></tr></thead>"
+    "<tbody><tr><td>id</td><td>{id}</td></tr>"
+    "<tr><td>path</td><td>{path}</td></tr>"
+    "<tr><td>new</td><td>{new}</td></tr>"
+    "<tr><td>learn</td><td>{learn}</td></tr>"
+    "<tr><td>review</td><td>{review}</td></tr>"
+    "<tr><td>total</td><td>{total}</td></tr>"
+    "</tbody></table>"
+    "<br/>"
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_field_cached(field_html: str) -> Mapping[str, str]:
+    """parse_card_field keyed on the raw HTML; repeated exports skip the
+    re-parse and identical fields across cards share one result. Callers
+    must treat the returned mapping as read-only."""
+    return parse_card_field(field_html)
+
+
+def _card_dump(card: Card) -> dict[str, Any]:
+    """save_json payload entry for one card; module-level so map() can drive it."""
+    return {
+        _K_NOTE_ID: card.id,
+        _K_FRONT: card.front,
+        _K_BACK: card.back,
+        _K_TAGS: "",
+    }
+
+
+@dataclass(slots=True)
 class OperationResult:
     """Result of a deck/card operation with user-friendly display."""
 
@@ -23,10 +125,10 @@ class OperationResult:
         return self.message
 
     def _repr_html_(self) -> str:
-        return f"<div>{self.message}</div>"
+        return _OP_REPR_TMPL.format_map({"message": self.message})
 
 
-@dataclass
+@dataclass(slots=True)
 class DeckListResult:
     top_node: object | None
     current_deck_id: int | None
@@ -35,9 +137,13 @@ class DeckListResult:
     decks_flat: list[Mapping[str, Any]]
     _client: RememberItClient | None = None
     _raw_html: str | None = None
+    _row_index: dict[str, Mapping[str, Any]] | None = None
+    _html_cache: str | None = None
 
-    def __iter__(self) -> Iterable[Mapping[str, Any]]:
-        return iter(self.decks_flat)
+    def __iter__(self) -> Iterator[Mapping[str, Any]]:
+        # Delegate straight to the list's iterator; skips the iter() builtin
+        # lookup on every `for row in result` loop.
+        return self.decks_flat.__iter__()
 
     def __len__(self) -> int:  # pragma: no cover - trivial
         return len(self.decks_flat)
@@ -45,43 +151,59 @@ class DeckListResult:
     def __getitem__(self, key: int | str) -> Mapping[str, Any]:
         if isinstance(key, int):
             return self.decks_flat[key]
-        for row in self.decks_flat:
-            if str(row.get("id")) == str(key) or row.get("name") == key or row.get("path") == key:
-                return row
-        raise KeyError(f"Deck not found for key: {key}")
+        # The result is read-only after construction, so an id/name/path ->
+        # row index built on first string lookup replaces the linear scan.
+        if self._row_index is None:
+            index: dict[str, Mapping[str, Any]] = {}
+            for row in self.decks_flat:
+                for alias in (str(row.get("id")), row.get("name"), row.get("path")):
+                    if alias is not None and alias not in index:
+                        index[alias] = row
+            self._row_index = index
+        try:
+            return self._row_index[str(key)]
+        except KeyError:
+            raise KeyError(f"Deck not found for key: {key}") from None
 
     def markdown(self) -> str:
         return decks_markdown_table(self.decks_flat)
 
     def _repr_html_(self) -> str:
-        # Render an HTML table for Jupyter
-        headers = ["id", "path", "new", "learn", "review", "total", "total_incl_children"]
-        rows = []
+        # Render an HTML table for Jupyter: one joined string per row
+        # collected into a list, then a single final join — O(n) bytes.
+        # The result is read-only after construction, so the rendered table
+        # is cached for Jupyter's repeated display calls.
+        if self._html_cache is not None:
+            return self._html_cache
+        parts: list[str] = []
+        append = parts.append
+        row_tmpl = _DECK_LIST_ROW_TMPL.format
         for row in self.decks_flat:
-            rows.append("<tr>" + "".join(f"<td>{row.get(h, '')}</td>" for h in headers) + "</tr>")
-        header_html = "<tr>" + "".join(f"<th>{h}</th>" for h in headers) + "</tr>"
-        return f"<table><thead>{header_html}</thead><tbody>{''.join(rows)}</tbody></table>"
+            try:
+                vals = _deck_row_get(row)
+            except KeyError:
+                get = row.get
+                vals = tuple(get(h, "") for h in _DECK_LIST_HEADERS)
+            append(row_tmpl(*vals))
+        self._html_cache = (
+            f"<table><thead>{_DECK_LIST_HEADER_ROW}</thead><tbody>{''.join(parts)}</tbody></table>"
+        )
+        return self._html_cache
 
 
-@dataclass
+@dataclass(slots=True)
 class CardSummary:
     id: str | None
     edit_url: str | None
     text: str
 
     def _repr_html_(self) -> str:
-        return (
-            "<table>"
-            "<thead><tr><th>field</th><th>value</th></tr></thead>"
-            "<tbody>"
-            f"<tr><td>id</td><td>{self.id}</td></tr>"
-            f"<tr><td>edit</td><td>{self.edit_url}</td></tr>"
-            f"<tr><td>text</td><td>{self.text}</td></tr>"
-            "</tbody></table>"
+        return _SUMMARY_REPR_TMPL.format_map(
+            {"id": self.id, "edit": self.edit_url, "text": self.text}
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Card:
     id: int | None
     front: str
@@ -153,15 +275,13 @@ class Card:
         return self
 
     def _repr_html_(self) -> str:
-        return (
-            "<table>"
-            "<thead><tr><th>field</th><th>value</th></tr></thead>"
-            "<tbody>"
-            f"<tr><td>id</td><td>{self.id}</td></tr>"
-            f"<tr><td>front</td><td>{self.front}</td></tr>"
-            f"<tr><td>back</td><td>{self.back}</td></tr>"
-            f"<tr><td>deck</td><td>{self.deck.path if self.deck else ''}</td></tr>"
-            "</tbody></table>"
+        return _CARD_REPR_TMPL.format_map(
+            {
+                "id": self.id,
+                "front": self.front,
+                "back": self.back,
+                "deck": self.deck.path if self.deck else "",
+            }
         )
 
     def __repr__(self) -> str:  # pragma: no cover - convenience
@@ -169,6 +289,195 @@ class Card:
 
 
 class CardCollection(list[Card]):
+    def __init__(
+        self,
+        cards: Iterable[Card] = (),
+        loader: Callable[[], list[Card]] | None = None,
+        count: int | None = None,
+    ) -> None:
+        """Card list, optionally populated on first access.
+
+        When a loader is given the Card objects are only built once the
+        collection is actually read. count lets len() answer without
+        triggering the load.
+        """
+        super().__init__(cards)
+        self._loader = loader
+        self._lazy_count = count
+        self._by_id_index: dict[str, Card] | None = None
+        self._by_front_index: dict[str, Card] | None = None
+        self._html_cache: str | None = None
+
+    def _materialize(self) -> None:
+        if self._loader is not None:
+            loader, self._loader = self._loader, None
+            super().extend(loader())
+
+    def _invalidate(self) -> None:
+        self._by_id_index = None
+        self._by_front_index = None
+        self._html_cache = None
+
+    def __len__(self) -> int:
+        if self._loader is not None and self._lazy_count is not None:
+            return self._lazy_count
+        self._materialize()
+        return super().__len__()
+
+    def __iter__(self) -> Iterator[Card]:
+        self._materialize()
+        return super().__iter__()
+
+    # Any structural change materializes first, then drops the indexes.
+    def append(self, card: Card) -> None:
+        self._materialize()
+        super().append(card)
+        self._invalidate()
+
+    def extend(self, cards: Iterable[Card]) -> None:
+        self._materialize()
+        super().extend(cards)
+        self._invalidate()
+
+    def insert(self, index: SupportsIndex, card: Card) -> None:
+        self._materialize()
+        super().insert(index, card)
+        self._invalidate()
+
+    def remove(self, card: Card) -> None:
+        self._materialize()
+        super().remove(card)
+        self._invalidate()
+
+    def pop(self, index: SupportsIndex = -1) -> Card:
+        self._materialize()
+        card = super().pop(index)
+        self._invalidate()
+        return card
+
+    def clear(self) -> None:
+        self._loader = None
+        self._lazy_count = None
+        super().clear()
+        self._invalidate()
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._materialize()
+        super().__setitem__(key, value)
+        self._invalidate()
+
+    def __delitem__(self, key: SupportsIndex | slice) -> None:
+        self._materialize()
+        super().__delitem__(key)
+        self._invalidate()
+
+    # Read-only list protocol still has to see the loaded cards.
+    def __contains__(self, item: object) -> bool:
+        self._materialize()
+        return super().__contains__(item)
+
+    def __reversed__(self) -> Iterator[Card]:
+        self._materialize()
+        return super().__reversed__()
+
+    def __eq__(self, other: object) -> bool:
+        self._materialize()
+        if isinstance(other, CardCollection):
+            other._materialize()
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        self._materialize()
+        if isinstance(other, CardCollection):
+            other._materialize()
+        return super().__ne__(other)
+
+    def __lt__(self, other: list[Card]) -> bool:
+        self._materialize()
+        if isinstance(other, CardCollection):
+            other._materialize()
+        return super().__lt__(other)
+
+    def __le__(self, other: list[Card]) -> bool:
+        self._materialize()
+        if isinstance(other, CardCollection):
+            other._materialize()
+        return super().__le__(other)
+
+    def __gt__(self, other: list[Card]) -> bool:
+        self._materialize()
+        if isinstance(other, CardCollection):
+            other._materialize()
+        return super().__gt__(other)
+
+    def __ge__(self, other: list[Card]) -> bool:
+        self._materialize()
+        if isinstance(other, CardCollection):
+            other._materialize()
+        return super().__ge__(other)
+
+    def __add__(self, other: list[Card]) -> list[Card]:  # type: ignore[override]
+        self._materialize()
+        if isinstance(other, CardCollection):
+            other._materialize()
+        return super().__add__(other)
+
+    def __iadd__(self, other: Iterable[Card]) -> CardCollection:  # type: ignore[override]
+        self._materialize()
+        if isinstance(other, CardCollection):
+            other._materialize()
+        result = super().__iadd__(other)
+        self._invalidate()
+        return result
+
+    def __mul__(self, n: SupportsIndex) -> list[Card]:
+        self._materialize()
+        return super().__mul__(n)
+
+    def __rmul__(self, n: SupportsIndex) -> list[Card]:
+        self._materialize()
+        return super().__rmul__(n)
+
+    def __imul__(self, n: SupportsIndex) -> CardCollection:
+        self._materialize()
+        result = super().__imul__(n)
+        self._invalidate()
+        return result
+
+    def index(self, card: Card, *args: SupportsIndex) -> int:
+        self._materialize()
+        return super().index(card, *args)
+
+    def count(self, card: Card) -> int:
+        self._materialize()
+        return super().count(card)
+
+    def copy(self) -> list[Card]:
+        self._materialize()
+        return super().copy()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self._materialize()
+        super().sort(*args, **kwargs)
+        self._invalidate()
+
+    def reverse(self) -> None:
+        self._materialize()
+        super().reverse()
+        self._invalidate()
+
+    def by_id(self) -> dict[str, Card]:
+        """Note-id (as str) -> Card index, built lazily; treat as read-only."""
+        if self._by_id_index is None:
+            self._by_id_index = {str(c.id): c for c in self if c.id is not None}
+        return self._by_id_index
+
+    def by_front(self) -> dict[str, Card]:
+        """Front-text -> Card index, built lazily; treat as read-only."""
+        if self._by_front_index is None:
+            self._by_front_index = {c.front: c for c in self}
+        return self._by_front_index
+
     @overload
     def __getitem__(self, key: SupportsIndex) -> Card: ...
     @overload
@@ -177,38 +486,35 @@ class CardCollection(list[Card]):
     def __getitem__(self, key: str) -> Card: ...
 
     def __getitem__(self, key: SupportsIndex | str | slice) -> Card | list[Card]:
+        self._materialize()
         if isinstance(key, slice):
             return super().__getitem__(key)
         if isinstance(key, str):
+            # Exact note-id hits resolve through the cached index; only
+            # substring front matches still need the scan.
+            card = self.by_id().get(key)
+            if card is not None:
+                return card
             key_lower = key.lower()
             for card in self:
-                front = (card.front or "").lower()
-                if (card.id is not None and str(card.id) == key) or key_lower in front:
+                if key_lower in (card.front or "").lower():
                     return card
             raise KeyError(f"Card not found for key: {key}")
         return super().__getitem__(key)
 
     def _repr_html_(self) -> str:
-        header_html = (
-            "<tr><th style='padding:8px;border:1px solid #444;'>id</th>"
-            "<th style='padding:8px;border:1px solid #444;'>front</th>"
-            "<th style='padding:8px;border:1px solid #444;'>back</th></tr>"
-        )
-        rows = []
-        for card in self:
-            rows.append(
-                f"<tr><td style='padding:8px;border:1px solid #444;vertical-align:top;'>"
-                f"{card.id}</td>"
-                f"<td style='padding:8px;border:1px solid #444;vertical-align:top;'>"
-                f"{card.front}</td>"
-                f"<td style='padding:8px;border:1px solid #444;vertical-align:top;'>"
-                f"{card.back}</td></tr>"
-            )
-        return (
+        # Repeated notebook displays of an unchanged collection reuse the
+        # rendered table; every mutator drops the cache via _invalidate.
+        if self._html_cache is not None:
+            return self._html_cache
+        row = _CARD_ROW_TMPL.format
+        rows = "".join([row(card.id, card.front, card.back) for card in self])
+        self._html_cache = (
             "<table style='border-collapse:collapse;width:100%;'>"
-            f"<thead style='background:#272822;color:#f8f8f2;'>{header_html}</thead>"
-            f"<tbody>{''.join(rows)}</tbody></table>"
+            f"<thead style='background:#272822;color:#f8f8f2;'>{_CARD_TABLE_HEADER}</thead>"
+            f"<tbody>{rows}</tbody></table>"
         )
+        return self._html_cache
 
 
 @dataclass
@@ -222,10 +528,15 @@ class Deck:
 
     @classmethod
     def from_row(cls, row: Mapping[str, Any], client: RememberItClient | None = None) -> Deck:
+        # Called once per deck during collection builds; bind the lookup and
+        # skip the str() coercion when the value is already a string.
+        get = row.get
+        name = get("name") or ""
+        path = get("path") or ""
         return cls(
-            id=row.get("id"),
-            name=str(row.get("name") or ""),
-            path=str(row.get("path") or ""),
+            id=get("id"),
+            name=name if type(name) is str else str(name),
+            path=path if type(path) is str else str(path),
             counts=row,
             cards=CardCollection(),
             _client=client,
@@ -242,12 +553,11 @@ class Deck:
         if not self._client:
             raise RuntimeError("No client attached to deck")
         collection = self._client.refresh_local()
-        for deck in collection:
-            if deck.id == self.id or deck.name == self.name:
-                self.cards = deck.cards
-                for card in self.cards:
-                    card.deck = self
-                return self
+        deck = collection.find(self.id, self.name)
+        if deck is not None:
+            self.cards = deck.cards
+            for card in self.cards:
+                card.deck = self
         return self
 
     def add_card(
@@ -340,17 +650,14 @@ class Deck:
         payload = {
             "name": self.name,
             "deck_id": self.id,
-            "cards": [
-                {
-                    "note_id": card.id,
-                    "front": card.front,
-                    "back": card.back,
-                    "tags": "",
-                }
-                for card in self.cards
-            ],
+            "cards": list(map(_card_dump, self.cards)),
         }
-        file_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        if orjson is not None:
+            file_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        else:
+            # Encode once and write bytes; write_text would re-walk the whole
+            # string through TextIOWrapper for the same result.
+            file_path.write_bytes(json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8"))
         return file_path
 
     def to_dict(self, *, raw: bool = False) -> dict[str, Any]:
@@ -367,28 +674,28 @@ class Deck:
         cards_list: list[dict[str, Any]] = []
         for card in self.cards:
             if raw:
-                cards_list.append({"front": card.front, "back": card.back})
+                cards_list.append({_K_FRONT: card.front, _K_BACK: card.back})
             else:
                 card_dict: dict[str, Any] = {}
                 # Parse front
-                front_parsed = parse_card_field(card.front)
-                card_dict["front"] = front_parsed["content"]
+                front_parsed = _parse_field_cached(card.front)
+                card_dict[_K_FRONT] = front_parsed["content"]
                 if front_parsed["type"] != "plain":
-                    card_dict["front_type"] = front_parsed["type"]
+                    card_dict[_K_FRONT_TYPE] = front_parsed["type"]
                     if "lang" in front_parsed:
-                        card_dict["front_lang"] = front_parsed["lang"]
+                        card_dict[_K_FRONT_LANG] = front_parsed["lang"]
                     if "theme" in front_parsed:
-                        card_dict["front_theme"] = front_parsed["theme"]
+                        card_dict[_K_FRONT_THEME] = front_parsed["theme"]
 
                 # Parse back
-                back_parsed = parse_card_field(card.back)
-                card_dict["back"] = back_parsed["content"]
+                back_parsed = _parse_field_cached(card.back)
+                card_dict[_K_BACK] = back_parsed["content"]
                 if back_parsed["type"] != "plain":
-                    card_dict["back_type"] = back_parsed["type"]
+                    card_dict[_K_BACK_TYPE] = back_parsed["type"]
                     if "lang" in back_parsed:
-                        card_dict["back_lang"] = back_parsed["lang"]
+                        card_dict[_K_BACK_LANG] = back_parsed["lang"]
                     if "theme" in back_parsed:
-                        card_dict["back_theme"] = back_parsed["theme"]
+                        card_dict[_K_BACK_THEME] = back_parsed["theme"]
 
                 cards_list.append(card_dict)
 
@@ -400,10 +707,21 @@ class Deck:
         Perfect for printing or passing to AI for editing.
 
         Args:
-            indent: JSON indentation level (default: 2)
+            indent: JSON indentation level (default: 2); pass 0 for compact output
             raw: If True, return raw HTML. If False (default), parse to plain text + metadata.
         """
-        return json.dumps(self.to_dict(raw=raw), ensure_ascii=False, indent=indent)
+        data = self.to_dict(raw=raw)
+        if orjson is not None:
+            # orjson only knows compact and 2-space output; other indents
+            # fall through to the stdlib encoder.
+            if not indent:
+                return orjson.dumps(data).decode()
+            if indent == 2:
+                return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        if not indent:
+            # Compact mode: skip the pretty-printer and drop the padding spaces.
+            return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        return json.dumps(data, ensure_ascii=False, indent=indent)
 
     def save_apkg(self, path: str, model_id: int = 1763445109221) -> Path:
         """
@@ -417,20 +735,31 @@ class Deck:
 
         deck_id = int(self.id) if self.id is not None else 0
         gdeck = genanki.Deck(deck_id, self.name or "")
-        model = genanki.Model(
-            model_id,
-            "Basic Model",
-            fields=[{"name": "Question"}, {"name": "Answer"}],
-            templates=[
-                {
-                    "name": "Card 1",
-                    "qfmt": "{{Question}}",
-                    "afmt": '{{FrontSide}}<hr id="answer">{{Answer}}',
-                }
-            ],
-        )
-        for card in self.cards:
-            gdeck.add_note(genanki.Note(model=model, fields=[card.front, card.back]))
+        model = _GENANKI_MODEL_CACHE.get(model_id)
+        if model is None:
+            model = _GENANKI_MODEL_CACHE[model_id] = genanki.Model(
+                model_id,
+                "Basic Model",
+                fields=[{"name": "Question"}, {"name": "Answer"}],
+                templates=[
+                    {
+                        "name": "Card 1",
+                        "qfmt": "{{Question}}",
+                        "afmt": '{{FrontSide}}<hr id="answer">{{Answer}}',
+                    }
+                ],
+            )
+        # Build all notes in one comprehension, then append them in bulk;
+        # genanki's add_note is just a list append, so extending the deck's
+        # notes list directly skips a method call per card.
+        make_note = genanki.Note
+        notes = [make_note(model=model, fields=[card.front, card.back]) for card in self.cards]
+        gnotes = getattr(gdeck, "notes", None)
+        if isinstance(gnotes, list):
+            gnotes.extend(notes)
+        else:  # pragma: no cover - genanki stopped exposing the list
+            for note in notes:
+                gdeck.add_note(note)
         pkg = genanki.Package(gdeck)
         pkg.write_to_file(path)
         return Path(path)
@@ -439,21 +768,18 @@ class Deck:
         return self.cards[key]
 
     def _repr_html_(self) -> str:
-        counts = {
-            "new": self.counts.get("new"),
-            "learn": self.counts.get("learn"),
-            "review": self.counts.get("review"),
-            "total": self.counts.get("total"),
-        }
-        info = "".join(f"<tr><td>{k}</td><td>{v}</td></tr>" for k, v in counts.items())
-        return (
-            "<table>"
-            "<thead><tr><th colspan='2'>Deck</th></tr></thead>"
-            f"<tbody><tr><td>id</td><td>{self.id}</td></tr>"
-            f"<tr><td>path</td><td>{self.path}</td></tr>"
-            f"{info}</tbody></table>"
-            "<br/>" + self.cards._repr_html_()
+        get = self.counts.get
+        info = _DECK_REPR_TMPL.format_map(
+            {
+                "id": self.id,
+                "path": self.path,
+                "new": get("new"),
+                "learn": get("learn"),
+                "review": get("review"),
+                "total": get("total"),
+            }
         )
+        return info + self.cards._repr_html_()
 
     def __repr__(self) -> str:  # pragma: no cover - convenience
         return f"Deck(id={self.id}, path={self.path!r}, cards={len(self.cards)})"
@@ -463,6 +789,32 @@ class DeckCollection(list[Deck]):
     def __init__(self, decks: Iterable[Deck], client: RememberItClient | None = None) -> None:
         super().__init__(decks)
         self._client = client
+        self._by_id: dict[str, Deck] | None = None
+        self._by_name: dict[str, Deck] | None = None
+
+    def _indexes(self) -> tuple[dict[str, Deck], dict[str, Deck]]:
+        """Lazily built id -> Deck and name -> Deck maps; rebuilt after append."""
+        if self._by_id is None or self._by_name is None:
+            by_id: dict[str, Deck] = {}
+            by_name: dict[str, Deck] = {}
+            for deck in self:
+                by_id.setdefault(str(deck.id), deck)
+                by_name.setdefault(deck.name, deck)
+            self._by_id, self._by_name = by_id, by_name
+        return self._by_id, self._by_name
+
+    def append(self, deck: Deck) -> None:
+        super().append(deck)
+        self._by_id = None
+        self._by_name = None
+
+    def find(self, deck_id: Any, name: str) -> Deck | None:
+        """Resolve a deck by id (preferred) or name without scanning the list."""
+        by_id, by_name = self._indexes()
+        target = by_id.get(str(deck_id)) if deck_id is not None else None
+        if target is None:
+            target = by_name.get(name)
+        return target
 
     def delete(self, deck: Deck | str | int) -> dict[str, Any]:
         if not self._client:
@@ -515,8 +867,6 @@ class DeckCollection(list[Deck]):
             return deck
 
     def _repr_html_(self) -> str:
-        header = "<tr><th>id</th><th>path</th><th>cards</th></tr>"
-        rows = "".join(
-            f"<tr><td>{d.id}</td><td>{d.path}</td><td>{len(d.cards)}</td></tr>" for d in self
-        )
-        return f"<table><thead>{header}</thead><tbody>{rows}</tbody></table>"
+        row = _DECK_COLL_ROW_TMPL.format
+        rows = "".join([row(d.id, d.path, len(d.cards)) for d in self])
+        return f"<table><thead>{_DECK_COLL_HEADER_ROW}</thead><tbody>{rows}</tbody></table>"
@@ -10,11 +10,16 @@ Custom templates: ~/.rememberit/templates/<name>.template
 
 from __future__ import annotations
 
+import string
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
 TEMPLATES_DIR = Path.home() / ".rememberit" / "templates"
 
+# One-pass HTML escaping for render_template; mirrors formatting.py.
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
 BUILTIN_TEMPLATES: dict[str, str] = {
     "code": """<div style="
 background:#272822; color:#f8f8f2; padding:16px 20px;
@@ -123,19 +128,43 @@ def _ensure_templates_dir() -> Path:
     return TEMPLATES_DIR
 
 
+# Last directory scan, keyed on (dir, mtime_ns); -1 means the dir is absent.
+# Carries both the name -> source dict and its name-sorted items so display
+# paths do not re-sort an unchanged listing.
+_LIST_CACHE: tuple[tuple[str, int], dict[str, str], tuple[tuple[str, str], ...]] | None = None
+
+
 def list_templates() -> dict[str, str]:
     """List all available templates (builtin + custom).
 
     Returns:
         Dict mapping template name to source ("builtin" or file path)
     """
+    global _LIST_CACHE
+
+    try:
+        mtime_ns = TEMPLATES_DIR.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = -1
+    key = (str(TEMPLATES_DIR), mtime_ns)
+    if _LIST_CACHE is not None and _LIST_CACHE[0] == key:
+        return dict(_LIST_CACHE[1])
+
     result: dict[str, str] = {name: "builtin" for name in BUILTIN_TEMPLATES}
 
-    if TEMPLATES_DIR.exists():
+    if mtime_ns != -1:
         for f in TEMPLATES_DIR.glob("*.template"):
             result[f.stem] = str(f)
 
-    return result
+    _LIST_CACHE = (key, result, tuple(sorted(result.items())))
+    return dict(result)
+
+
+def _sorted_templates() -> tuple[tuple[str, str], ...]:
+    """Name-sorted (name, source) pairs, computed once per directory state."""
+    list_templates()  # refresh _LIST_CACHE if stale
+    assert _LIST_CACHE is not None
+    return _LIST_CACHE[2]
 
 
 def get_template(name: str) -> str | None:
@@ -149,7 +178,17 @@ def get_template(name: str) -> str | None:
     Returns:
         Template HTML string or None if not found
     """
-    custom_path = TEMPLATES_DIR / f"{name}.template"
+    return _read_template_cached(name, str(TEMPLATES_DIR))
+
+
+@lru_cache(maxsize=256)
+def _read_template_cached(name: str, dir_str: str) -> str | None:
+    """Resolve and read a template once per (name, directory).
+
+    The directory is part of the key so reassigning TEMPLATES_DIR (as the
+    tests do) cannot serve stale entries; save/delete clear the cache.
+    """
+    custom_path = Path(dir_str) / f"{name}.template"
     if custom_path.exists():
         return custom_path.read_text(encoding="utf-8")
 
@@ -169,9 +208,13 @@ def save_template(name: str, html: str) -> Path:
     if "{content}" not in html:
         raise ValueError("Template must contain {content} placeholder")
 
+    global _LIST_CACHE
+
     _ensure_templates_dir()
     path = TEMPLATES_DIR / f"{name}.template"
     path.write_text(html, encoding="utf-8")
+    _read_template_cached.cache_clear()
+    _LIST_CACHE = None
     return path
 
 
@@ -184,9 +227,13 @@ def delete_template(name: str) -> bool:
     Returns:
         True if deleted, False if not found (builtin templates cannot be deleted)
     """
+    global _LIST_CACHE
+
     path = TEMPLATES_DIR / f"{name}.template"
     if path.exists():
         path.unlink()
+        _read_template_cached.cache_clear()
+        _LIST_CACHE = None
         return True
     return False
 
@@ -221,13 +268,63 @@ def render_template(name: str, content: str, **kwargs: Any) -> str:
     if template is None:
         raise ValueError(f"Template not found: {name}")
 
-    escaped = (
-        content.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
+    escaped = content.translate(_HTML_ESCAPE_TABLE)
+    segments = _compile_template(template)
+    if segments is None:
+        return template.format(content=escaped, **kwargs)
+
+    values = {"content": escaped, **kwargs}
+    parts: list[str] = []
+    append = parts.append
+    for literal, field in segments:
+        if literal:
+            append(literal)
+        if field is not None:
+            append(str(values[field]))
+    return "".join(parts)
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template: str) -> tuple[tuple[str, str | None], ...] | None:
+    """Split a template into (literal, field) segments once per template.
+
+    Returns None for templates using format specs, conversions, attribute
+    or index access, or auto-numbered fields; those fall back to
+    str.format so the full mini-language keeps working.
+    """
+    segments: list[tuple[str, str | None]] = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if spec or conversion:
+            return None
+        if field is not None and (not field or "." in field or "[" in field):
+            return None
+        segments.append((literal, field))
+    return tuple(segments)
+
+
+_BUILTIN_BADGE = (
+    "<span style='background:#4CAF50;color:white;padding:2px 8px;"
+    "border-radius:4px;font-size:0.8em;'>builtin</span>"
+)
+_CUSTOM_BADGE = (
+    "<span style='background:#2196F3;color:white;padding:2px 8px;"
+    "border-radius:4px;font-size:0.8em;'>custom</span>"
+)
+
+
+def _preview_row(name: str, source_badge: str) -> str:
+    preview = render_template(name, f"Example {name} card")
+    return (
+        f"<tr><td style='padding:12px;border:1px solid #444;vertical-align:top;'>"
+        f"<b>{name}</b><br/>{source_badge}</td>"
+        f"<td style='padding:12px;border:1px solid #444;'>{preview}</td></tr>"
     )
-    return template.format(content=escaped, **kwargs)
+
+
+@cache
+def _builtin_preview_row(name: str) -> str:
+    """Builtin previews never change; render each row once per process."""
+    return _preview_row(name, _BUILTIN_BADGE)
 
 
 def show_templates() -> None:
@@ -239,24 +336,17 @@ def show_templates() -> None:
     except ImportError:
         has_ipython = False
 
-    templates = list_templates()
+    templates = _sorted_templates()
 
     if has_ipython:
         rows = []
-        for name, source in sorted(templates.items()):
-            source_badge = (
-                "<span style='background:#4CAF50;color:white;padding:2px 8px;"
-                "border-radius:4px;font-size:0.8em;'>builtin</span>"
-                if source == "builtin"
-                else "<span style='background:#2196F3;color:white;padding:2px 8px;"
-                "border-radius:4px;font-size:0.8em;'>custom</span>"
-            )
-            preview = render_template(name, f"Example {name} card")
-            rows.append(
-                f"<tr><td style='padding:12px;border:1px solid #444;vertical-align:top;'>"
-                f"<b>{name}</b><br/>{source_badge}</td>"
-                f"<td style='padding:12px;border:1px solid #444;'>{preview}</td></tr>"
-            )
+        for name, source in templates:
+            if source == "builtin":
+                # A custom file shadowing a builtin name reports its path as
+                # source, so the cached row is only used for true builtins.
+                rows.append(_builtin_preview_row(name))
+            else:
+                rows.append(_preview_row(name, _CUSTOM_BADGE))
 
         html = f"""
 <div style="background:#1F1F1F;border:1px solid #3A3A3A;border-radius:12px;
@@ -277,7 +367,7 @@ border-radius:4px;">~/.rememberit/templates/</code>
         display(HTML(html))  # type: ignore[no-untyped-call]
     else:
         print("Available templates:")
-        for name, source in sorted(templates.items()):
+        for name, source in templates:
             print(f"  {name} ({source})")
 
 
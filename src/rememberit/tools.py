@@ -6,21 +6,62 @@ In normal Jupyter, this module is a no-op.
 
 from __future__ import annotations
 
-from inspect import currentframe
+import json
+import sys
+import threading
+from types import FrameType
+from typing import Any
+
+
+class _LazyModule:
+    """Import-on-first-use module proxy.
+
+    Tool bodies used to re-run `import rememberit` on every call; the proxy
+    imports once and then forwards attribute access to the live module, so
+    monkeypatching rememberit.* in tests still takes effect.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._module: Any = None
+
+    def __getattr__(self, attr: str) -> Any:
+        module = self._module
+        if module is None:
+            import importlib
+
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+
+rememberit = _LazyModule("rememberit")
 
 _SOLVEIT_AVAILABLE = False
 _TOOLS_REGISTERED = False
 _dh = None
 
+# Threads seen inside a dialog context; only positive answers are cached
+# because a dialog does not vanish mid-thread, while a negative one can
+# flip once dialoghelper injects its globals. load_tools(force=True) resets.
+_SOLVEIT_CTX_CACHE: dict[int, bool] = {}
+
 
 def _in_solveit_context() -> bool:
     """Check if we're running inside a solveit dialog."""
-    frame = currentframe()
-    if frame is None:
+    ident = threading.get_ident()
+    if _SOLVEIT_CTX_CACHE.get(ident):
+        return True
+    # sys._getframe skips the inspect wrapper; frame 1 is our caller.
+    frame: FrameType | None
+    try:
+        frame = sys._getframe(1)
+    except ValueError:  # pragma: no cover - no caller frame
         return False
-    frame = frame.f_back
     while frame:
-        if "__dialog_name" in frame.f_globals or "__dialog_name" in frame.f_locals:
+        # __dialog_name is injected at dialog (module) level, so f_globals is
+        # enough; touching f_locals would rebuild the locals dict per frame.
+        if "__dialog_name" in frame.f_globals:
+            _SOLVEIT_CTX_CACHE[ident] = True
             return True
         frame = frame.f_back
     return False
@@ -55,8 +96,6 @@ def list_decks() -> str:
     3. Edit the cards as needed
     4. rememberit.upsert_deck(deck_data) - submit changes
     """
-    import rememberit
-
     collection = rememberit.decks()
     if not collection:
         return "No decks found. Try `rememberit_sync_anki()` first."
@@ -77,13 +116,12 @@ def get_deck(deck_name: str) -> str:
     Args:
         deck_name: Name or path of the deck to retrieve
     """
-    import rememberit
-
     collection = rememberit.decks()
     try:
         deck = collection[deck_name]
         deck.sync()
-        return deck.json()
+        deck_json: str = deck.json()
+        return deck_json
     except KeyError:
         return f"Deck '{deck_name}' not found. Use rememberit_list_decks() to see available decks."
 
@@ -131,8 +169,6 @@ def add_card(
     rememberit_add_card("Python", "Important!", "Answer", front_theme="purple")
     ```
     """
-    import rememberit
-
     card: dict[str, str | None] = {
         "front": front,
         "back": back,
@@ -178,8 +214,6 @@ def add_code_card(
     )
     ```
     """
-    import rememberit
-
     card_data = {
         "name": deck_name,
         "cards": [
@@ -218,10 +252,6 @@ def add_cards(deck_name: str, cards_json: str) -> str:
 
     **Tip:** Use `rememberit.upsert_deck(deck_data)` for bulk add/update with deck name.
     """
-    import json
-
-    import rememberit
-
     cards = json.loads(cards_json)
     if not isinstance(cards, list):
         return "Error: cards_json must be a JSON array"
@@ -289,8 +319,6 @@ def update_card(
     rememberit_update_card("Python", "Important Q", front_theme="purple")
     ```
     """
-    import rememberit
-
     collection = rememberit.decks()
     try:
         deck = collection[deck_name]
@@ -318,8 +346,6 @@ def create_deck(name: str) -> str:
     Args:
         name: Name for the new deck (use :: for hierarchy, e.g. "Parent::Child")
     """
-    import rememberit
-
     rememberit.create_deck(name)
     return f"✓ Deck '{name}' created"
 
@@ -330,16 +356,12 @@ def delete_deck(name: str) -> str:
     Args:
         name: Name of the deck to delete
     """
-    import rememberit
-
     rememberit.delete_deck(name)
     return f"✓ Deck '{name}' deleted"
 
 
 def sync_anki() -> str:
     """Sync with AnkiWeb to get latest changes."""
-    import rememberit
-
     collection = rememberit.sync()
     total_cards = sum(len(d.cards) for d in collection)
     return f"✓ Synced {len(collection)} decks, {total_cards} total cards"
@@ -370,10 +392,6 @@ def upsert_deck(deck_json: str) -> str:
     **Themes:** random, gradient, dark, light, blue, purple, green, orange
     **Languages:** python, javascript, typescript, html, css, sql, bash, json, etc.
     """
-    import json
-
-    import rememberit
-
     data = json.loads(deck_json)
     deck = rememberit.upsert_deck(data)
     return f"✓ Upserted deck '{deck.name}' with {len(deck.cards)} cards"
@@ -393,10 +411,6 @@ def deck_as_dict(deck_key: str) -> str:
     2. Edit the cards array as needed
     3. Submit: `rememberit.upsert_deck(deck_data)` in Python
     """
-    import json
-
-    import rememberit
-
     collection = rememberit.decks()
     try:
         if deck_key.isdigit():
@@ -809,6 +823,8 @@ def load_tools(silent: bool = False, force: bool = False) -> None:
         dict with keys: solveit (bool), registered (bool), tools (list[str])
     """
     global _TOOLS_REGISTERED
+    if force:
+        _SOLVEIT_CTX_CACHE.clear()
     in_solveit = is_solveit()
 
     if in_solveit and (not _TOOLS_REGISTERED or force):
@@ -816,8 +832,10 @@ def load_tools(silent: bool = False, force: bool = False) -> None:
 
         # Namespace tools with rememberit_ prefix
         namespaced_tools = []
-        frame = currentframe()
-        caller_globals = frame.f_back.f_globals if frame and frame.f_back else {}
+        try:
+            caller_globals = sys._getframe(1).f_globals
+        except ValueError:  # pragma: no cover - no caller frame
+            caller_globals = {}
 
         for tool in TOOLS:
             # Create namespaced name
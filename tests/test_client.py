@@ -188,3 +188,103 @@ class TestRunInThread:
 
         with pytest.raises(ValueError, match="test error"):
             _run_in_thread(raises)
+
+
+class _FakeNote:
+    """Stand-in for anki.notes.Note with just the fields the client touches."""
+
+    def __init__(self, col: object, model: object) -> None:
+        self.id = 0
+        self.fields = ["", ""]
+        self.tags: list[str] = []
+
+
+class TestAddCards:
+    """Tests for RememberItClient.add_cards."""
+
+    def test_adds_each_card_to_deck(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import anki.collection  # noqa: F401 - anki.notes needs the package initialized
+
+        from rememberit.client import RememberItClient, Session
+
+        monkeypatch.setattr("anki.notes.Note", _FakeNote)
+        col = MagicMock()
+        c = RememberItClient(session=Session(hkey="k", endpoint="e"))
+        monkeypatch.setattr(c, "_ensure_collection", lambda: col)
+
+        result = c.add_cards(
+            5, [{"front": "Q1", "back": "A1", "tags": "a b"}, {"front": "Q2", "back": "A2"}]
+        )
+
+        assert result == {"status_code": 200, "added": 2}
+        assert col.add_note.call_count == 2
+        notes = [call.args[0] for call in col.add_note.call_args_list]
+        assert notes[0].fields == ["Q1", "A1"]
+        assert notes[0].tags == ["a", "b"]
+        assert notes[1].fields == ["Q2", "A2"]
+        assert all(call.kwargs == {"deck_id": 5} for call in col.add_note.call_args_list)
+
+    def test_missing_basic_model_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from rememberit.client import RememberItClient, RememberItError, Session
+
+        col = MagicMock()
+        col.models.by_name.return_value = None
+        c = RememberItClient(session=Session(hkey="k", endpoint="e"))
+        monkeypatch.setattr(c, "_ensure_collection", lambda: col)
+
+        with pytest.raises(RememberItError, match="Basic note type"):
+            c.add_cards(5, [{"front": "Q", "back": "A"}])
+
+
+class TestBulkUpsert:
+    """Tests for RememberItClient.bulk_upsert."""
+
+    def test_empty_is_a_noop(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from rememberit.client import RememberItClient, Session
+
+        c = RememberItClient(session=Session(hkey="k", endpoint="e"))
+        ensure = MagicMock()
+        monkeypatch.setattr(c, "_ensure_collection", ensure)
+
+        result = c.bulk_upsert(5, [], [])
+
+        assert result == {"status_code": 200, "added": 0, "updated": 0}
+        ensure.assert_not_called()
+
+    def test_adds_and_updates(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import anki.collection  # noqa: F401 - anki.notes needs the package initialized
+
+        from rememberit.client import RememberItClient, Session
+
+        monkeypatch.setattr("anki.notes.Note", _FakeNote)
+        col = MagicMock()
+        existing = _FakeNote(col, None)
+        col.get_note.return_value = existing
+        c = RememberItClient(session=Session(hkey="k", endpoint="e"))
+        monkeypatch.setattr(c, "_ensure_collection", lambda: col)
+
+        result = c.bulk_upsert(
+            5,
+            adds=[{"front": "Q1", "back": "A1"}],
+            updates=[{"note_id": 7, "front": "Q0", "back": "A0", "tags": "x"}],
+        )
+
+        assert result == {"status_code": 200, "added": 1, "updated": 1}
+        col.get_note.assert_called_once_with(7)
+        assert existing.fields == ["Q0", "A0"]
+        assert existing.tags == ["x"]
+        col.update_note.assert_called_once_with(existing)
+        col.add_note.assert_called_once()
+        assert col.add_note.call_args.args[0].fields == ["Q1", "A1"]
+        assert c._deck_cache == {}
+
+    def test_update_missing_note_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from rememberit.client import RememberItClient, RememberItError, Session
+
+        col = MagicMock()
+        col.get_note.return_value = None
+        c = RememberItClient(session=Session(hkey="k", endpoint="e"))
+        monkeypatch.setattr(c, "_ensure_collection", lambda: col)
+
+        with pytest.raises(RememberItError, match="Note not found"):
+            c.bulk_upsert(5, adds=[], updates=[{"note_id": 9, "front": "Q", "back": "A"}])
@@ -21,3 +21,18 @@ def test_save_and_load_settings(monkeypatch, tmp_path) -> None:
     assert loaded.password == settings.password
     assert loaded.user_agent == settings.user_agent
     assert loaded.cookie_header == settings.cookie_header
+
+
+def test_cached_load_sees_saves(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("REMEMBERIT_CONFIG_DIR", str(tmp_path))
+
+    save_settings(Settings(email="first@example.com"))
+    loaded = load_settings()
+    assert loaded.email == "first@example.com"
+
+    # Mutating a loaded copy must not leak into later loads
+    loaded.email = "mutated@example.com"
+    assert load_settings().email == "first@example.com"
+
+    save_settings(Settings(email="second@example.com"))
+    assert load_settings().email == "second@example.com"
@@ -85,6 +85,94 @@ class TestCardCollection:
         assert coll[0].front == "Q1"
         assert coll[1].front == "Q2"
 
+    def test_by_front_index(self) -> None:
+        from rememberit.models import Card, CardCollection
+
+        cards = [
+            Card(id=1, front="Q1", back="A1", raw_text="", edit_url=None),
+            Card(id=2, front="Q2", back="A2", raw_text="", edit_url=None),
+        ]
+        coll = CardCollection(cards)
+
+        index = coll.by_front()
+        assert index["Q1"].back == "A1"
+        assert coll.by_front() is index  # cached until mutation
+
+    def test_indexes_invalidated_on_mutation(self) -> None:
+        from rememberit.models import Card, CardCollection
+
+        coll = CardCollection([Card(id=1, front="Q1", back="A1", raw_text="", edit_url=None)])
+        assert "Q2" not in coll.by_front()
+        assert "2" not in coll.by_id()
+
+        coll.append(Card(id=2, front="Q2", back="A2", raw_text="", edit_url=None))
+        assert coll.by_front()["Q2"].back == "A2"
+        assert coll.by_id()["2"].front == "Q2"
+
+
+class TestLazyCardCollection:
+    """Tests for loader-backed CardCollection materialization."""
+
+    @staticmethod
+    def _cards() -> list:
+        from rememberit.models import Card
+
+        return [
+            Card(id=1, front="Q1", back="A1", raw_text="", edit_url=None),
+            Card(id=2, front="Q2", back="A2", raw_text="", edit_url=None),
+        ]
+
+    def _lazy(self):
+        from rememberit.models import CardCollection
+
+        return CardCollection(loader=self._cards, count=2)
+
+    def test_len_without_loading(self) -> None:
+        coll = self._lazy()
+        assert len(coll) == 2
+        assert coll._loader is not None  # len answered from count, no load
+
+    def test_loader_runs_once_on_access(self) -> None:
+        coll = self._lazy()
+        assert [c.front for c in coll] == ["Q1", "Q2"]
+        assert coll._loader is None
+
+    def test_contains_and_lookup_materialize(self) -> None:
+        card = self._cards()[0]
+        assert card in self._lazy()
+        assert self._lazy().index(card) == 0
+        assert self._lazy().count(card) == 1
+        assert self._lazy()["1"].front == "Q1"
+
+    def test_equality_materializes_both_sides(self) -> None:
+        from rememberit.models import CardCollection
+
+        assert self._lazy() == self._lazy()
+        assert not (self._lazy() != self._lazy())
+        assert self._lazy() != CardCollection()
+
+    def test_copies_and_views_materialize(self) -> None:
+        assert [c.front for c in self._lazy().copy()] == ["Q1", "Q2"]
+        assert [c.front for c in reversed(self._lazy())] == ["Q2", "Q1"]
+        assert len(self._lazy() + self._cards()) == 4
+        assert len(self._lazy() * 2) == 4
+
+    def test_iadd_appends_after_loaded_cards(self) -> None:
+        from rememberit.models import Card
+
+        coll = self._lazy()
+        coll += [Card(id=3, front="Q3", back="A3", raw_text="", edit_url=None)]
+        assert [c.front for c in coll] == ["Q1", "Q2", "Q3"]
+        assert len(coll) == 3
+
+    def test_mutation_materializes_first(self) -> None:
+        from rememberit.models import Card
+
+        coll = self._lazy()
+        coll.append(Card(id=3, front="Q3", back="A3", raw_text="", edit_url=None))
+        assert [c.front for c in coll] == ["Q1", "Q2", "Q3"]
+        assert coll.by_id()["3"].front == "Q3"
+
 
 class TestDeck:
     """Tests for Deck class."""